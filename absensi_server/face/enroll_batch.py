@@ -0,0 +1,284 @@
+import cv2, os, sys, time
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from quality import FACE_SIZE, crop_with_padding
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATASET_DIR = os.path.join(BASE_DIR, "dataset")
+
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".bmp")
+VIDEO_EXTS = (".mp4", ".avi", ".mov", ".mkv", ".webm", ".h264")
+
+FRAMES_PER_JOB = 60      # Potongan video per job; kecil supaya UID yang sudah penuh cepat berhenti
+IMAGES_PER_JOB = 50      # Jumlah foto per job worker
+
+# Cascade di-load sekali per worker (lihat _init_worker)
+face_cascade = None
+
+def sanitize_uid(raw_uid):
+    return raw_uid.replace(":", "-").strip().upper()
+
+def load_cascade():
+    # Try standard path first, then fallback to built-in OpenCV path
+    local_cascade = os.path.join(BASE_DIR, "cascades", "haarcascade_frontalface_default.xml")
+    if os.path.exists(local_cascade):
+        cascade_path = local_cascade
+    else:
+        cascade_path = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+
+    cascade = cv2.CascadeClassifier(cascade_path)
+    if cascade.empty():
+        raise RuntimeError(f"Haarcascade gagal load dari: {cascade_path}")
+    return cascade
+
+def dhash(img):
+    """
+    Perceptual hash 64-bit (difference hash) untuk deteksi frame yang nyaris sama.
+    """
+    small = cv2.resize(img, (9, 8), interpolation=cv2.INTER_AREA)
+    diff = small[:, 1:] > small[:, :-1]
+    value = 0
+    for bit in diff.flatten():
+        value = (value << 1) | int(bit)
+    return value
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+def crop_largest_face(gray):
+    """
+    Ambil wajah terbesar + padding, resize ke 200x200 (logic sama dengan enroll.py).
+    Return None jika tidak ada wajah.
+    """
+    faces = face_cascade.detectMultiScale(gray, 1.2, 5)
+    if len(faces) == 0:
+        return None
+
+    faces_sorted = sorted(faces, key=lambda f: f[2]*f[3], reverse=True)
+    face_img = crop_with_padding(gray, faces_sorted[0])
+    if face_img.size == 0:
+        return None
+    return cv2.resize(face_img, FACE_SIZE)
+
+# --- WORKER SIDE ---
+def _init_worker():
+    global face_cascade
+    face_cascade = load_cascade()
+    # Satu thread OpenCV per proses, paralelisme dari process pool
+    cv2.setNumThreads(1)
+
+def _process_job(job, limit, min_distance):
+    """
+    Jalankan deteksi + crop untuk satu job.
+    job = (uid, kind, payload); kind "video" -> (path, start, end, step), "images" -> [paths]
+    Berhenti lebih awal jika sudah dapat `limit` crop unik (dedup lokal di job ini),
+    karena sisa target UID tidak mungkin butuh lebih dari itu.
+    Return (uid, [(hash, crop), ...]) urut sesuai frame/foto.
+    """
+    uid, kind, payload = job
+    results = []
+
+    def add(crop):
+        h = dhash(crop)
+        if any(hamming(h, old) < min_distance for old, _ in results):
+            return False
+        results.append((h, crop))
+        return len(results) >= limit
+
+    if kind == "video":
+        path, start, end, step = payload
+        cap = cv2.VideoCapture(path)
+        if not cap.isOpened():
+            print(f"[WARN] Video gagal dibuka: {path}")
+            return uid, results
+        cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+        idx = start
+        while idx < end:
+            # grab() tanpa decode penuh untuk frame yang di-skip
+            if (idx - start) % step != 0:
+                if not cap.grab():
+                    break
+                idx += 1
+                continue
+            ret, frame = cap.read()
+            if not ret:
+                break
+            idx += 1
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            crop = crop_largest_face(gray)
+            if crop is not None and add(crop):
+                break
+        cap.release()
+    else:
+        for path in payload:
+            gray = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+            if gray is None:
+                print(f"[WARN] Gagal baca: {path}")
+                continue
+            crop = crop_largest_face(gray)
+            if crop is not None and add(crop):
+                break
+
+    return uid, results
+
+# --- MAIN SIDE ---
+def build_jobs(uid, source, frame_step):
+    """
+    Pecah satu sumber (file video / folder foto / folder berisi video) jadi beberapa job.
+    """
+    jobs = []
+
+    if os.path.isdir(source):
+        entries = sorted(os.listdir(source))
+        images = [os.path.join(source, fn) for fn in entries if fn.lower().endswith(IMAGE_EXTS)]
+        videos = [os.path.join(source, fn) for fn in entries if fn.lower().endswith(VIDEO_EXTS)]
+        for i in range(0, len(images), IMAGES_PER_JOB):
+            jobs.append((uid, "images", images[i:i+IMAGES_PER_JOB]))
+        for video in videos:
+            jobs.extend(build_jobs(uid, video, frame_step))
+        return jobs
+
+    if source.lower().endswith(IMAGE_EXTS):
+        return [(uid, "images", [source])]
+
+    cap = cv2.VideoCapture(source)
+    if not cap.isOpened():
+        print(f"[WARN] Sumber tidak valid, dilewati: {source}")
+        return jobs
+    total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+
+    if total <= 0:
+        # Frame count tidak diketahui (stream/container aneh): satu job untuk seluruh video
+        jobs.append((uid, "video", (source, 0, sys.maxsize, frame_step)))
+        return jobs
+
+    for start in range(0, total, FRAMES_PER_JOB):
+        jobs.append((uid, "video", (source, start, min(start + FRAMES_PER_JOB, total), frame_step)))
+    return jobs
+
+def load_existing(save_dir):
+    """
+    Baca dataset yang sudah ada supaya nomor file lanjut dan foto lama ikut di-dedup.
+    """
+    hashes = []
+    last_num = 0
+    for fn in sorted(os.listdir(save_dir)):
+        if not fn.lower().endswith(".png"):
+            continue
+        stem = os.path.splitext(fn)[0]
+        if stem.isdigit():
+            last_num = max(last_num, int(stem))
+        img = cv2.imread(os.path.join(save_dir, fn), cv2.IMREAD_GRAYSCALE)
+        if img is not None:
+            hashes.append(dhash(img))
+    return hashes, last_num
+
+def parse_sources(items):
+    """
+    Format argumen: UID=PATH (UID boleh pakai ':' atau '-').
+    UID yang sama boleh muncul beberapa kali.
+    """
+    sources = []
+    for item in items:
+        if "=" not in item:
+            raise SystemExit(f"Format salah: {item} (harus UID=PATH)")
+        raw_uid, path = item.split("=", 1)
+        uid = sanitize_uid(raw_uid)
+        if not uid or not os.path.exists(path):
+            raise SystemExit(f"UID kosong atau path tidak ada: {item}")
+        sources.append((uid, path))
+    return sources
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Batch enroll (headless) dari file video / folder foto untuk banyak UID."
+    )
+    parser.add_argument("sources", nargs="+", help="UID=PATH, contoh AA:BB:CC:DD=/data/andi.mp4")
+    parser.add_argument("--target", type=int, default=120, help="Maks foto per UID (default 120)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Jumlah proses worker")
+    parser.add_argument("--frame-step", type=int, default=5, help="Ambil 1 dari N frame video (default 5)")
+    parser.add_argument("--min-distance", type=int, default=6,
+                        help="Jarak hamming dHash minimum agar foto dianggap beda (default 6)")
+    args = parser.parse_args()
+
+    sources = parse_sources(args.sources)
+    # Validasi cascade di proses utama dulu, biar error jelas (bukan BrokenProcessPool)
+    load_cascade()
+
+    # State per UID: hash yang sudah disimpan, nomor file terakhir, jumlah foto baru
+    state = {}
+    jobs = []
+    for uid, path in sources:
+        if uid not in state:
+            save_dir = os.path.join(DATASET_DIR, uid)
+            os.makedirs(save_dir, exist_ok=True)
+            hashes, last_num = load_existing(save_dir)
+            state[uid] = {"dir": save_dir, "hashes": hashes, "num": last_num, "saved": 0, "dup": 0}
+        jobs.extend(build_jobs(uid, path, max(1, args.frame_step)))
+
+    if not jobs:
+        raise SystemExit("Tidak ada sumber valid untuk diproses.")
+
+    print("\n=== BATCH ENROLL MODE ===")
+    print(f"- UID    : {', '.join(state)}")
+    print(f"- Jobs   : {len(jobs)} | Workers: {args.workers}")
+    print(f"- Target : {args.target} foto per UID\n")
+
+    started = time.time()
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as pool:
+        # Job di-submit bertahap (maks 2x workers yang antre) dan hasil diproses sesuai
+        # urutan job -> dedup deterministik. UID yang sudah penuh tidak di-submit lagi
+        # dan job-nya yang masih antre di-cancel, jadi video sisa tidak ikut di-decode.
+        pending = deque()
+        next_job = 0
+        skipped = 0
+
+        def is_full(uid):
+            return state[uid]["saved"] >= args.target
+
+        while next_job < len(jobs) or pending:
+            while next_job < len(jobs) and len(pending) < 2 * args.workers:
+                job = jobs[next_job]
+                next_job += 1
+                if is_full(job[0]):
+                    skipped += 1
+                    continue
+                remaining = args.target - state[job[0]]["saved"]
+                pending.append((job[0], pool.submit(_process_job, job, remaining, args.min_distance)))
+            if not pending:
+                break
+
+            uid, future = pending.popleft()
+            if future.cancelled():
+                continue
+            _, results = future.result()
+            st = state[uid]
+            for h, crop in results:
+                if is_full(uid):
+                    break
+                if any(hamming(h, old) < args.min_distance for old in st["hashes"]):
+                    st["dup"] += 1
+                    continue
+                st["num"] += 1
+                out_path = os.path.join(st["dir"], f"{st['num']:03d}.png")
+                cv2.imwrite(out_path, crop)
+                st["hashes"].append(h)
+                st["saved"] += 1
+
+            if is_full(uid):
+                for other_uid, other in pending:
+                    if other_uid == uid and other.cancel():
+                        skipped += 1
+
+    elapsed = time.time() - started
+    print("=== HASIL ===")
+    for uid, st in state.items():
+        print(f"{uid}: +{st['saved']} foto (duplikat dibuang: {st['dup']}) -> {st['dir']}")
+    print(f"Job dilewati (target UID sudah tercapai): {skipped}")
+    print(f"\nSelesai dalam {elapsed:.1f} detik. Jalankan train.py untuk update model.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import cv2
+import os
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# --- CONFIG ---
+# Harus sama dengan crop dataset dari enroll.py / enroll_batch.py
+FACE_SIZE = (200, 200)
+PADDING = 10
+
+# Threshold dikalibrasi dari crop enroll di face/dataset (60 foto frontal):
+# - sharpness: min 33.7, p5 119.8, median 361.6
+# - 2 mata terdeteksi: offset titik tengah mata p95 0.085, max 0.157
+#   (wajah yang menoleh ~0.4, lihat commit message)
+MIN_FACE_SIZE = 60       # Sisi bbox minimum (pixel frame asli), verify.py pakai juga sebagai minSize cascade
+MIN_SHARPNESS = 25.0     # Variance Laplacian minimum (di crop 200x200)
+GOOD_SHARPNESS = 300.0   # Di atas ini skor sharpness dianggap penuh
+MAX_EYE_OFFSET = 0.2     # Jarak titik tengah 2 mata dari tengah crop (0..1), besar = wajah menoleh
+
+# Deteksi mata di crop yang diperkecil: cukup akurat untuk pose, jauh lebih murah
+EYE_SCAN_SIZE = (150, 150)
+EYE_SCAN_ROWS = 90       # Hanya 60% atas wajah (area mata)
+
+_eye_cascade = None
+
+def _get_eye_cascade():
+    # Lazy load: train.py / enroll_batch.py import modul ini tanpa butuh cascade mata
+    global _eye_cascade
+    if _eye_cascade is None:
+        # Try standard path first, then fallback to built-in OpenCV path
+        local_cascade = os.path.join(BASE_DIR, "cascades", "haarcascade_eye.xml")
+        if os.path.exists(local_cascade):
+            cascade_path = local_cascade
+        else:
+            cascade_path = cv2.data.haarcascades + "haarcascade_eye.xml"
+        cascade = cv2.CascadeClassifier(cascade_path)
+        if cascade.empty():
+            raise RuntimeError(f"Haarcascade mata gagal load dari: {cascade_path}")
+        _eye_cascade = cascade
+    return _eye_cascade
+
+def crop_with_padding(gray, box, padding=PADDING):
+    """
+    Crop wajah + margin supaya dagu/jidat tidak kepotong (sama dengan enroll.py).
+    """
+    x, y, w, h = box
+    h_pad = min(h + 2*padding, gray.shape[0] - y)
+    w_pad = min(w + 2*padding, gray.shape[1] - x)
+    y_pad = max(0, y - padding)
+    x_pad = max(0, x - padding)
+    return gray[y_pad:y_pad+h_pad, x_pad:x_pad+w_pad]
+
+def normalize_face(face_img):
+    """
+    Resize ke ukuran training + equalize histogram.
+    Dipakai di train.py dan verify.py supaya input LBPH konsisten.
+    """
+    if face_img.shape[:2] != (FACE_SIZE[1], FACE_SIZE[0]):
+        face_img = cv2.resize(face_img, FACE_SIZE, interpolation=cv2.INTER_AREA)
+    return cv2.equalizeHist(face_img)
+
+def sharpness(face_img):
+    return cv2.Laplacian(face_img, cv2.CV_64F).var()
+
+def eye_offset(face_img):
+    """
+    Proxy pose: posisi mata di crop 200x200.
+    Return None jika tidak ada mata, -1.0 jika hanya 1 mata (pose tidak pasti),
+    atau offset 0 (frontal) .. 1 titik tengah 2 mata terbesar dari tengah crop.
+    """
+    scan = cv2.resize(face_img, EYE_SCAN_SIZE, interpolation=cv2.INTER_AREA)[:EYE_SCAN_ROWS]
+    side = EYE_SCAN_SIZE[0]
+    eyes = _get_eye_cascade().detectMultiScale(
+        scan, scaleFactor=1.15, minNeighbors=3,
+        minSize=(side // 10, side // 10), maxSize=(side * 2 // 5, side * 2 // 5)
+    )
+    if len(eyes) == 0:
+        return None
+    if len(eyes) == 1:
+        return -1.0
+    eyes = sorted(eyes, key=lambda e: e[2]*e[3], reverse=True)[:2]
+    mid_x = sum(x + w / 2 for x, y, w, h in eyes) / 2
+    return abs(mid_x - side / 2) / (side / 2)
+
+def face_quality(crop, face_side):
+    """
+    Skor kualitas crop 200x200 (belum di-equalize).
+    Return (score, None) atau (None, reason) jika ditolak.
+    """
+    if face_side < MIN_FACE_SIZE:
+        return None, "small"
+
+    # Sharpness diukur sebelum equalize (equalize menaikkan kontras & Laplacian)
+    sharp = sharpness(crop)
+    if sharp < MIN_SHARPNESS:
+        return None, "blur"
+
+    offset = eye_offset(crop)
+    if offset is None or offset > MAX_EYE_OFFSET:
+        return None, "pose"
+    # 1 mata: kemungkinan frontal tapi tidak pasti -> skor pose setengah
+    pose = 0.5 if offset < 0 else 1.0 - offset / MAX_EYE_OFFSET
+
+    score = (0.5 * min(sharp / GOOD_SHARPNESS, 1.0)
+             + 0.3 * min(face_side / (3 * MIN_FACE_SIZE), 1.0)
+             + 0.2 * pose)
+    return score, None
+
+def assess_face(gray, box):
+    """
+    Crop + hitung kualitas satu deteksi wajah.
+    Return (face_img_200x200_equalized, score) atau (None, reason) jika ditolak.
+    """
+    x, y, w, h = box
+    face_side = min(w, h)
+    if face_side < MIN_FACE_SIZE:
+        return None, "small"
+
+    crop = crop_with_padding(gray, box)
+    if crop.size == 0:
+        return None, "empty"
+    crop = cv2.resize(crop, FACE_SIZE, interpolation=cv2.INTER_AREA)
+
+    score, reason = face_quality(crop, face_side)
+    if score is None:
+        return None, reason
+    return cv2.equalizeHist(crop), score
@@ -2,6 +2,8 @@ import cv2
 import os
 import numpy as np
 
+from quality import normalize_face
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATASET_DIR = os.path.join(BASE_DIR, "dataset")
 MODEL_DIR = os.path.join(BASE_DIR, "model")
@@ -41,7 +43,8 @@ for uid, label in uid_to_label.items():
         if img is None:
             print("Gagal baca:", img_path)
             continue
-        X.append(img)
+        # Normalisasi sama persis dengan ROI di verify.py (200x200 + equalize)
+        X.append(normalize_face(img))
         y.append(label)
 
 if not X:
@@ -3,6 +3,9 @@ import os
 import sqlite3
 import time
 import sys
+import multiprocessing
+
+from quality import MIN_FACE_SIZE, assess_face
 
 # --- CONFIG ---
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -17,10 +20,42 @@ DEBOUNCE_SECONDS = 3.0       # Jeda log yang sama
 # Change to False if you want to debug with GUI window
 HEADLESS = True 
 
+# --- MULTI-CAMERA CONFIG ---
+# Satu worker process per kamera. Format: READER_ID=SOURCE dipisah koma,
+# SOURCE = index device (0, 1, ...) atau path file video. Contoh:
+#   FACE_CAMERAS="PINTU-A=0,PINTU-B=1"
+# Kosong = mode lama (1 kamera, index 0 fallback 1, tanpa reader ID).
+FACE_CAMERAS = os.environ.get("FACE_CAMERAS", "")
+WORKER_RESTART_SECONDS = 5.0  # Jeda restart worker kamera yang mati
+
+# --- ADAPTIVE IDLE CONFIG ---
+# Saat koridor kosong, Haar cascade tidak dijalankan. Yang jalan hanya
+# frame-difference di frame kecil (murah) dengan capture rate rendah.
+# verify.py membuat face_wake[_<READER>].flag saat start; server.py hanya update mtime saat /tap
+WAKE_FLAG_DIR = os.path.join(BASE_DIR, "..", "face_wake")
+MOTION_SIZE = (64, 48)        # Resolusi frame kecil untuk deteksi gerakan
+MOTION_PIXEL_DELTA = 25       # Selisih intensitas minimum per pixel
+MOTION_MIN_RATIO = 0.01       # Minimal 1% pixel berubah = ada gerakan
+IDLE_AFTER_SECONDS = 10.0     # Tanpa gerakan/wajah selama ini -> masuk IDLE
+ACTIVE_INTERVAL = 0.01        # Jeda loop saat ada wajah
+SEARCH_INTERVAL = 0.05        # Jeda loop saat ACTIVE tapi belum ada wajah
+IDLE_INTERVAL = 0.5           # Jeda loop saat IDLE (~2 fps)
+STATS_INTERVAL = 60.0         # Laporan CPU & wake-up latency tiap N detik
+
+# --- QUALITY GATING / TRACKING CONFIG ---
+# Predict hanya dijalankan pada beberapa frame terbaik per orang (track),
+# bukan di setiap ROI mentah dari cascade.
+TRACK_IOU = 0.3               # IoU minimum agar deteksi dianggap orang yang sama
+TRACK_TIMEOUT = 1.0           # Track dibuang jika tidak terlihat selama N detik
+TRACK_WINDOW = 0.8            # Lama kumpulkan kandidat frame sebelum verdict (detik)
+TRACK_MAX_CANDIDATES = 8      # Atau verdict lebih cepat jika kandidat sudah sebanyak ini
+BEST_FRAMES = 3               # Jumlah frame terbaik yang di-predict per verdict
+
 # --- DATABASE LOGGING FUNCTION ---
-def log_face_event(uid, name, status):
+def log_face_event(uid, name, status, reader_id=None):
     """
     Mencatat event wajah ke database agar bisa dibaca oleh server.py saat Tap Kartu.
+    reader_id = ID kamera/pintu, dipakai server untuk mencocokkan tap dari reader yang sama.
     """
     # Fix: Convert filename format (dash) back to ESP32 format (colon)
     # Folder: AA-BB-CC-DD -> DB: AA:BB:CC:DD
@@ -31,17 +66,256 @@ def log_face_event(uid, name, status):
         cursor = conn.cursor()
         
         # Insert event
-        cursor.execute('''
-            INSERT INTO attendance (uid, nama, nim, action, face_status) 
-            VALUES (?, ?, ?, ?, ?)
-        ''', (db_uid, name, "-", "FACE_LOG", status))
+        # Mode 1 kamera (tanpa reader_id) tetap pakai kolom lama, aman untuk DB yang belum dimigrasi
+        if reader_id:
+            cursor.execute('''
+                INSERT INTO attendance (uid, nama, nim, action, face_status, reader_id) 
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (db_uid, name, "-", "FACE_LOG", status, reader_id))
+        else:
+            cursor.execute('''
+                INSERT INTO attendance (uid, nama, nim, action, face_status) 
+                VALUES (?, ?, ?, ?, ?)
+            ''', (db_uid, name, "-", "FACE_LOG", status))
         
         conn.commit()
         conn.close()
-        print(f"[DB] Logged: {db_uid} | {status}")
+        print(f"[DB] Logged: {db_uid} | {status} | Reader: {reader_id or '-'}")
     except Exception as e:
         print(f"[DB ERROR] {e}")
 
+def ensure_reader_column():
+    """
+    Migrasi yang sama dengan init_db() di server.py, supaya verify.py boleh
+    di-restart/deploy sebelum server.py tanpa error "no such column: reader_id".
+    """
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(attendance)")]
+        if columns and 'reader_id' not in columns:
+            print("Migrating DB: Adding reader_id column...")
+            conn.execute("ALTER TABLE attendance ADD COLUMN reader_id TEXT DEFAULT NULL")
+            conn.commit()
+        conn.close()
+    except Exception as e:
+        print(f"Migration warning: {e}")
+
+# --- ADAPTIVE IDLE SCHEDULER ---
+class IdleScheduler:
+    """
+    Mengatur mode ACTIVE/IDLE berdasarkan gerakan, wajah, dan wake request dari server.
+    Juga mencatat CPU usage dan wake-up latency untuk dilaporkan berkala.
+    """
+    def __init__(self, wake_flag_path, extra_stats=None, log_prefix=""):
+        now = time.time()
+        self.wake_flag_path = wake_flag_path
+        self.extra_stats = extra_stats  # Callable -> string tambahan untuk laporan [STATS]
+        self.log_prefix = log_prefix    # Contoh "[PINTU-A] " di mode multi-kamera
+        self.mode = "ACTIVE"           # Mulai ACTIVE supaya langsung siap setelah restart
+        self.last_activity = now
+        self.prev_small = None
+        self.wake_flag_mtime = self._flag_mtime()
+
+        # Stats
+        self.pending_wake = None       # (reason, trigger_ts) menunggu deteksi pertama
+        self.wake_latencies = {"motion": [], "tap": []}
+        self.wake_counts = {"motion": 0, "tap": 0}
+        self.frames = 0
+        self.detections = 0
+        self.idle_seconds = 0.0
+        self.last_tick = now
+        self.stats_wall = now
+        self.stats_cpu = time.process_time()
+
+    def _flag_mtime(self):
+        try:
+            return os.path.getmtime(self.wake_flag_path)
+        except OSError:
+            return 0.0
+
+    def has_motion(self, frame):
+        # Resize dulu baru grayscale: jauh lebih murah daripada full-frame cvtColor
+        small = cv2.resize(frame, MOTION_SIZE, interpolation=cv2.INTER_AREA)
+        small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        prev, self.prev_small = self.prev_small, small
+        if prev is None:
+            return False
+        diff = cv2.absdiff(small, prev)
+        changed = cv2.countNonZero(cv2.threshold(diff, MOTION_PIXEL_DELTA, 255, cv2.THRESH_BINARY)[1])
+        return changed >= MOTION_MIN_RATIO * diff.size
+
+    def has_tap_request(self):
+        mtime = self._flag_mtime()
+        if mtime > self.wake_flag_mtime:
+            self.wake_flag_mtime = mtime
+            return True
+        return False
+
+    def update(self, frame):
+        """
+        Dipanggil tiap frame. Return True jika face detection perlu dijalankan.
+        """
+        now = time.time()
+        self.frames += 1
+        prev_tick = self.last_tick
+        if self.mode == "IDLE":
+            self.idle_seconds += now - prev_tick
+        self.last_tick = now
+
+        motion = self.has_motion(frame)
+        tapped = self.has_tap_request()
+        if motion or tapped:
+            self.last_activity = now
+            if self.mode == "IDLE":
+                reason = "tap" if tapped else "motion"
+                # Tap: latency dihitung dari waktu server menulis flag.
+                # Motion: dari frame IDLE sebelumnya (gerakan paling awal yang belum terlihat),
+                # jadi jeda IDLE_INTERVAL yang dialami user ikut terhitung.
+                trigger_ts = self.wake_flag_mtime if tapped else prev_tick
+                self.mode = "ACTIVE"
+                self.pending_wake = (reason, trigger_ts)
+                self.wake_counts[reason] += 1
+                print(f"{self.log_prefix}[SCHED] Wake up ({reason}) -> ACTIVE")
+        elif self.mode == "ACTIVE" and now - self.last_activity > IDLE_AFTER_SECONDS:
+            self.mode = "IDLE"
+            self.prev_small = None
+            print(f"{self.log_prefix}[SCHED] No activity for {IDLE_AFTER_SECONDS:.0f}s -> IDLE")
+
+        self.report(now)
+        return self.mode == "ACTIVE"
+
+    def after_detect(self, face_found):
+        now = time.time()
+        self.detections += 1
+        if face_found:
+            self.last_activity = now
+        if self.pending_wake:
+            reason, trigger_ts = self.pending_wake
+            self.wake_latencies[reason].append(max(0.0, now - trigger_ts))
+            self.pending_wake = None
+
+    def interval(self, face_found):
+        if self.mode == "IDLE":
+            return IDLE_INTERVAL
+        return ACTIVE_INTERVAL if face_found else SEARCH_INTERVAL
+
+    def report(self, now):
+        wall = now - self.stats_wall
+        if wall < STATS_INTERVAL:
+            return
+        cpu = time.process_time() - self.stats_cpu
+        latency = {}
+        for reason, samples in self.wake_latencies.items():
+            if samples:
+                avg_ms = 1000 * sum(samples) / len(samples)
+                latency[reason] = f"avg {avg_ms:.0f}ms / max {1000 * max(samples):.0f}ms"
+            else:
+                latency[reason] = "-"
+        print(f"{self.log_prefix}[STATS] Mode: {self.mode} | CPU: {100 * cpu / wall:.1f}% | "
+              f"FPS: {self.frames / wall:.1f} | Detect: {self.detections} | "
+              f"Idle: {100 * min(self.idle_seconds, wall) / wall:.0f}% | "
+              f"Wake motion/tap: {self.wake_counts['motion']}/{self.wake_counts['tap']} | "
+              f"Wake latency motion: {latency['motion']} | tap: {latency['tap']}")
+        if self.extra_stats:
+            print(f"{self.log_prefix}[STATS] {self.extra_stats()}")
+
+        self.frames = 0
+        self.detections = 0
+        self.idle_seconds = 0.0
+        self.wake_latencies = {"motion": [], "tap": []}
+        self.wake_counts = {"motion": 0, "tap": 0}
+        self.stats_wall = now
+        self.stats_cpu = time.process_time()
+
+# --- FACE TRACKER (BEST-FRAME SELECTION) ---
+def box_iou(a, b):
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    ix = max(0, min(ax + aw, bx + bw) - max(ax, bx))
+    iy = max(0, min(ay + ah, by + bh) - max(ay, by))
+    inter = ix * iy
+    union = aw * ah + bw * bh - inter
+    return inter / union if union > 0 else 0.0
+
+class FaceTracker:
+    """
+    Mengelompokkan deteksi antar frame menjadi track per orang, menyimpan kandidat
+    frame yang lolos quality gate, lalu menghasilkan satu verdict dari BEST_FRAMES terbaik.
+    """
+    def __init__(self):
+        self.tracks = []
+        self.predicts = 0
+        self.verdicts = 0
+        self.rejected = {"small": 0, "blur": 0, "pose": 0, "empty": 0}
+
+    def update(self, gray, faces):
+        """
+        Return list (track, verdict) untuk track yang siap di-verdict di frame ini.
+        verdict = (label, confidence) atau None jika predict gagal.
+        """
+        now = time.time()
+        ready = []
+
+        for box in faces:
+            box = tuple(int(v) for v in box)
+            track = max(self.tracks, key=lambda t: box_iou(t["box"], box), default=None)
+            if track is None or box_iou(track["box"], box) < TRACK_IOU:
+                track = {"box": box, "first_ts": now, "candidates": [], "label_text": None}
+                self.tracks.append(track)
+            track["box"] = box
+            track["last_ts"] = now
+
+            face_img, score = assess_face(gray, box)
+            if face_img is None:
+                self.rejected[score] += 1
+                continue
+            if not track["candidates"]:
+                track["first_ts"] = now  # Window dihitung dari frame bagus pertama
+            track["candidates"].append((score, face_img))
+
+            window_done = now - track["first_ts"] >= TRACK_WINDOW
+            if len(track["candidates"]) >= TRACK_MAX_CANDIDATES or window_done:
+                ready.append((track, self.recognize(track)))
+
+        # Track yang hilang: verdict dari kandidat yang sempat terkumpul, lalu buang
+        alive = []
+        for track in self.tracks:
+            if now - track["last_ts"] <= TRACK_TIMEOUT:
+                alive.append(track)
+            elif track["candidates"]:
+                ready.append((track, self.recognize(track)))
+        self.tracks = alive
+        return ready
+
+    def recognize(self, track):
+        best = sorted(track["candidates"], key=lambda c: c[0], reverse=True)[:BEST_FRAMES]
+        track["candidates"] = []
+
+        votes = {}
+        for _, face_img in best:
+            try:
+                label, confidence = recognizer.predict(face_img)
+            except Exception as e:
+                print(f"Error predict: {e}")
+                continue
+            self.predicts += 1
+            votes.setdefault(label, []).append(confidence)
+        if not votes:
+            return None
+
+        # Label dengan vote terbanyak; seri -> rata-rata confidence (jarak) terkecil
+        label, scores = min(votes.items(), key=lambda kv: (-len(kv[1]), sum(kv[1]) / len(kv[1])))
+        self.verdicts += 1
+        return label, sum(scores) / len(scores)
+
+    def summary(self):
+        line = (f"Verdicts: {self.verdicts} | Predict calls: {self.predicts} | "
+                f"Rejected small/blur/pose: {self.rejected['small']}/{self.rejected['blur']}/{self.rejected['pose']}")
+        self.predicts = 0
+        self.verdicts = 0
+        self.rejected = {k: 0 for k in self.rejected}
+        return line
+
 # --- LOAD RESOURCES ---
 try:
     if not os.path.exists(MODEL_PATH) or not os.path.exists(LABELS_PATH):
@@ -63,7 +337,7 @@ except Exception as e:
     print(f"[CRITICAL] Failed to load resources: {e}")
     sys.exit(1)
 
-# --- INIT CAMERA & CASCADE ---
+# --- INIT CASCADE ---
 # Use local cascade file
 cascade_path = os.path.join(BASE_DIR, "cascades", "haarcascade_frontalface_default.xml")
 
@@ -72,86 +346,148 @@ if face_cascade.empty():
     print(f"[CRITICAL] Haarcascade failed to load from: {cascade_path}")
     sys.exit(1)
 
-cap = cv2.VideoCapture(0)
-if not cap.isOpened():
-    print("Webcam index 0 failed, trying index 1...")
-    cap = cv2.VideoCapture(1)
+def parse_cameras(spec):
+    """
+    "PINTU-A=0,PINTU-B=/path/video.mp4" -> [("PINTU-A", 0), ("PINTU-B", "/path/video.mp4")]
+    Kosong -> [(None, None)] (mode lama, 1 kamera tanpa reader ID).
+    """
+    cameras = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        if "=" not in item:
+            raise ValueError(f"Format FACE_CAMERAS salah: {item} (harus READER_ID=SOURCE)")
+        reader_id, source = (part.strip() for part in item.split("=", 1))
+        reader_id = reader_id.upper()
+        if not reader_id or not all(c.isalnum() or c in "-_" for c in reader_id):
+            raise ValueError(f"Reader ID tidak valid: {reader_id!r} (huruf/angka/-/_ saja)")
+        if any(reader_id == existing for existing, _ in cameras):
+            raise ValueError(f"Reader ID duplikat: {reader_id}")
+        cameras.append((reader_id, int(source) if source.isdigit() else source))
+    return cameras or [(None, None)]
+
+def wake_flag_path(reader_id):
+    # Harus sama dengan wake_face_service() di server.py
+    name = f"face_wake_{reader_id}.flag" if reader_id else "face_wake.flag"
+    return os.path.join(WAKE_FLAG_DIR, name)
+
+def create_wake_flags(cameras):
+    """
+    Buat flag untuk reader yang benar-benar dijalankan. server.py tidak membuat file
+    baru, jadi reader_id asing dari /tap tidak bisa menambah file di disk.
+    """
+    os.makedirs(WAKE_FLAG_DIR, exist_ok=True)
+    for reader_id, _ in cameras:
+        with open(wake_flag_path(reader_id), "a"):
+            pass
+
+def open_camera(source):
+    if source is not None:
+        cap = cv2.VideoCapture(source)
+        return cap if cap.isOpened() else None
+
+    cap = cv2.VideoCapture(0)
     if not cap.isOpened():
-        print("[CRITICAL] No camera found.")
+        print("Webcam index 0 failed, trying index 1...")
+        cap = cv2.VideoCapture(1)
+        if not cap.isOpened():
+            return None
+    return cap
+
+# --- CAMERA WORKER ---
+def run_camera(reader_id, source):
+    """
+    Loop utama satu kamera. Di mode multi-kamera dijalankan sebagai worker process;
+    recognizer & cascade diwarisi dari parent (fork) dan hanya dibaca.
+    """
+    prefix = f"[{reader_id}]" if reader_id else "[DEBUG]"
+    window_name = f"WebAbsen Face Monitor {reader_id}" if reader_id else "WebAbsen Face Monitor"
+    is_file = isinstance(source, str)
+
+    cap = open_camera(source)
+    if cap is None:
+        print(f"[CRITICAL] No camera found. {prefix} Source: {source}")
         sys.exit(1)
 
-print("\n=== FACE MONITOR RUNNING ===")
-print(f"Threshold: {CONFIDENCE_THRESHOLD}")
-print(f"Headless: {HEADLESS}")
-print("Press 'q' to quit (if GUI enabled).\n")
+    # Buffer kecil supaya frame tidak basi saat capture rate diturunkan (IDLE)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    # Paralelisme dari worker process, bukan dari thread OpenCV
+    if reader_id:
+        cv2.setNumThreads(1)
 
-# --- MAIN LOOP ---
-last_log_time = {} # {uid: timestamp}
-last_logged_status = "UNKNOWN"
-
-while True:
-    ret, frame = cap.read()
-    if not ret:
-        time.sleep(0.1)
-        continue
-
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    faces = face_cascade.detectMultiScale(
-        gray, 
-        scaleFactor=1.2, 
-        minNeighbors=5, 
-        minSize=(30, 30)
-    )
-
-    # 1. Logic Wajah Hilang -> Reset Status Local
-    if len(faces) == 0:
-        if last_logged_status != "UNKNOWN":
+    print(f"{prefix} Camera ready: {source if source is not None else 'default'}")
+
+    # --- MAIN LOOP ---
+    last_log_time = {} # {uid: timestamp}
+    last_logged_status = "UNKNOWN"
+    tracker = FaceTracker()
+    scheduler = IdleScheduler(wake_flag_path(reader_id), extra_stats=tracker.summary,
+                              log_prefix=f"{prefix} " if reader_id else "")
+
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            if is_file:
+                # File video habis: ulang dari awal (untuk testing/replay)
+                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            time.sleep(0.1)
+            continue
+
+        # 0. IDLE: skip Haar cascade, cukup cek gerakan dengan capture rate rendah
+        if not scheduler.update(frame):
             last_logged_status = "UNKNOWN"
-            # print("Face lost. Reset status.")
-        
-        # Hemat CPU saat idle
-        if HEADLESS:
-            time.sleep(0.05)
+            if not HEADLESS:
+                cv2.imshow(window_name, frame)
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break
+            time.sleep(IDLE_INTERVAL)
+            continue
+
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        faces = face_cascade.detectMultiScale(
+            gray, 
+            scaleFactor=1.2, 
+            minNeighbors=5, 
+            # Sama dengan quality gate: wajah lebih kecil pasti ditolak, jangan dideteksi
+            minSize=(MIN_FACE_SIZE, MIN_FACE_SIZE)
+        )
+        scheduler.after_detect(len(faces) > 0)
+
+        # 1. Logic Wajah Hilang -> Reset Status Local
+        if len(faces) == 0:
+            if last_logged_status != "UNKNOWN":
+                last_logged_status = "UNKNOWN"
+                # print("Face lost. Reset status.")
+
+        # 2. Quality gate + kumpulkan frame terbaik per track, predict hanya saat verdict
+        for track, verdict in tracker.update(gray, faces):
+            if verdict is None:
+                continue
+            label, confidence = verdict
 
-    for (x, y, w, h) in faces:
-        # Visual Box
-        if not HEADLESS:
-            cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
-        
-        # Predict
-        face_roi = gray[y:y+h, x:x+w]
-        try:
-            label, confidence = recognizer.predict(face_roi)
-            
             # Logic Klasifikasi
             uid_found_temp = label_to_uid.get(label, "Unknown")
-            print(f"[DEBUG] Pred: {uid_found_temp} | Score: {round(confidence, 1)} | Thr: {CONFIDENCE_THRESHOLD}")
+            print(f"{prefix} Pred: {uid_found_temp} | Score: {round(confidence, 1)} | Thr: {CONFIDENCE_THRESHOLD}")
 
             if confidence < CONFIDENCE_THRESHOLD:
                 uid_found = uid_found_temp
                 status = "MATCH"
-                color = (0, 255, 0)
             elif confidence < (CONFIDENCE_THRESHOLD + 20.0):
                 # GRAY AREA LOGIC (Fix Ghost Match)
                 # If score is slightly bad (e.g. 50 vs 45), log it as "Reyka: MISMATCH"
                 # instead of "UNKNOWN". This forces Server to see the latest status.
                 uid_found = uid_found_temp
                 status = "MISMATCH"
-                color = (0, 165, 255) # Orange
             else:
                 # Totally unknown / stranger
                 uid_found = "UNKNOWN"
                 status = "MISMATCH"
-                color = (0, 0, 255)
-
-            # Display Text
-            if not HEADLESS:
-                text = f"{uid_found} ({round(confidence)})"
-                cv2.putText(frame, text, (x, y-10), cv2.FONT_HERSHEY_SIMPLEX, 0.8, color, 2)
+            track["label_text"] = (uid_found, status, confidence)
 
             # --- LOGGING LOGIC ---
             now = time.time()
-            
+        
             # Log jika:
             # 1. Status wajah BERUBAH (Contoh: UNKNOWN -> MATCH)
             # 2. Atau Debounce time sudah lewat (Update berkala)
@@ -165,21 +501,85 @@ while True:
                 if status == "UNKNOWN" and not is_status_change:
                     pass 
                 else:
-                    log_face_event(uid_found, "Auto-Detect", status)
+                    log_face_event(uid_found, "Auto-Detect", status, reader_id)
                     last_log_time[uid_found] = now
                     last_logged_status = status
 
-        except Exception as e:
-            print(f"Error predict: {e}")
+        # Visual Box + verdict terakhir per track
+        if not HEADLESS:
+            for track in tracker.tracks:
+                x, y, w, h = track["box"]
+                color = (255, 255, 0)  # Cyan: masih mengumpulkan frame
+                if track["label_text"]:
+                    uid_found, status, confidence = track["label_text"]
+                    if status == "MATCH":
+                        color = (0, 255, 0)
+                    elif uid_found != "UNKNOWN":
+                        color = (0, 165, 255) # Orange
+                    else:
+                        color = (0, 0, 255)
+                    text = f"{uid_found} ({round(confidence)})"
+                    cv2.putText(frame, text, (x, y-10), cv2.FONT_HERSHEY_SIMPLEX, 0.8, color, 2)
+                cv2.rectangle(frame, (x, y), (x+w, y+h), color, 2)
+
+        # GUI handling
+        if not HEADLESS:
+            cv2.imshow(window_name, frame)
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                break
+        else:
+            # Jeda adaptif: cepat saat ada wajah, lebih santai saat mencari
+            time.sleep(scheduler.interval(len(faces) > 0))
+
+    cap.release()
+    cv2.destroyAllWindows()
+
+def supervise(cameras):
+    """
+    Jalankan satu process per kamera dan restart worker yang mati.
+    Model sudah di-load di parent sebelum fork, jadi tidak di-load ulang per kamera.
+    """
+    ctx = multiprocessing.get_context("fork")
+    workers = {}
+
+    def spawn(reader_id, source):
+        proc = ctx.Process(target=run_camera, args=(reader_id, source), name=f"face-{reader_id}", daemon=True)
+        proc.start()
+        workers[reader_id] = (proc, source)
 
-    # GUI handling
-    if not HEADLESS:
-        cv2.imshow("WebAbsen Face Monitor", frame)
-        if cv2.waitKey(1) & 0xFF == ord('q'):
-            break
-    else:
-        # Sleep kecil di mode headless agar loop tidak makan CPU 100%
-        time.sleep(0.01)
+    for reader_id, source in cameras:
+        spawn(reader_id, source)
+
+    try:
+        while True:
+            time.sleep(WORKER_RESTART_SECONDS)
+            for reader_id, (proc, source) in list(workers.items()):
+                if not proc.is_alive():
+                    print(f"[SUPERVISOR] Worker {reader_id} exited ({proc.exitcode}), restarting...")
+                    spawn(reader_id, source)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for proc, _ in workers.values():
+            proc.terminate()
+
+try:
+    cameras = parse_cameras(FACE_CAMERAS)
+except ValueError as e:
+    print(f"[CRITICAL] {e}")
+    sys.exit(1)
+
+ensure_reader_column()
+create_wake_flags(cameras)
+
+print("\n=== FACE MONITOR RUNNING ===")
+print(f"Threshold: {CONFIDENCE_THRESHOLD}")
+print(f"Headless: {HEADLESS}")
+print(f"Idle after: {IDLE_AFTER_SECONDS}s (wake on motion / tap)")
+print(f"Cameras: {', '.join(f'{r}={src}' for r, src in cameras) if cameras[0][0] else 'default'}")
+print("Press 'q' to quit (if GUI enabled).\n")
 
-cap.release()
-cv2.destroyAllWindows()
+if len(cameras) == 1:
+    run_camera(*cameras[0])
+else:
+    supervise(cameras)
@@ -8,6 +8,10 @@ import os
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_NAME = os.path.join(BASE_DIR, "absensi.db")
+# Flag file yang di-touch saat /tap agar face/verify.py keluar dari mode IDLE
+# (multi-kamera: face_wake_<READER_ID>.flag per reader). File dibuat oleh verify.py
+# hanya untuk reader yang dijalankan; server tidak pernah membuat file baru.
+FACE_WAKE_DIR = os.path.join(BASE_DIR, "face_wake")
 
 
 # Database Initialization
@@ -48,6 +52,14 @@ def init_db():
         except Exception as e:
             print(f"Migration warning: {e}")
 
+    # Multi-camera: reader_id menandai kamera/pintu asal event (NULL = single camera lama)
+    if 'reader_id' not in columns:
+        try:
+            print("Migrating DB: Adding reader_id column...")
+            c.execute("ALTER TABLE attendance ADD COLUMN reader_id TEXT DEFAULT NULL")
+        except Exception as e:
+            print(f"Migration warning: {e}")
+
     conn.commit()
     conn.close()
 
@@ -56,6 +68,17 @@ def get_db_connection():
     conn.row_factory = sqlite3.Row
     return conn
 
+def wake_face_service(reader_id=None):
+    # Cukup update mtime; verify.py mengecek mtime tiap frame (murah, tanpa query DB)
+    name = f"face_wake_{reader_id}.flag" if reader_id else "face_wake.flag"
+    flag_path = os.path.join(FACE_WAKE_DIR, name)
+    if not os.path.isfile(flag_path):
+        return  # Tidak ada face worker untuk reader ini
+    try:
+        os.utime(flag_path, None)
+    except Exception as e:
+        print(f"[WAKE WARNING] {e}")
+
 # --- API ENDPOINTS ---
 
 # Global Heartbeat Tracker
@@ -81,10 +104,18 @@ def tap():
         
         # V2.5: Optional face verification status from face reco server
         face_status = data.get('face_status', 'UNKNOWN') 
+
+        # Multi-camera: ID reader/pintu, harus sama dengan READER_ID di FACE_CAMERAS verify.py
+        reader_id = (data.get('reader_id') or '').strip().upper() or None
+        if reader_id and not all(ch.isalnum() or ch in '-_' for ch in reader_id):
+            return jsonify({"status": "error", "message": "Invalid reader_id"}), 400
         
         # DEBUG: Log incoming payload
         print(f"[TAP] Payload: {data}")
 
+        # Bangunkan face service (jika IDLE) supaya tap berikutnya sudah dapat status wajah
+        wake_face_service(reader_id)
+
         conn = get_db_connection()
         cursor = conn.cursor()
 
@@ -95,19 +126,23 @@ def tap():
 
         # SYNC FIX: If face_status is UNKNOWN, check if we have a recent (30s) record with a valid status
         # This handles cases where Face Rec writes to DB *before* the ESP32 tap
+        # Multi-camera: only trust face events from the camera at the same reader
         if face_status == 'UNKNOWN':
             try:
-                recent_face_row = conn.execute('''
+                reader_filter = "AND reader_id = ?" if reader_id else ""
+                params = (uid, reader_id) if reader_id else (uid,)
+                recent_face_row = conn.execute(f'''
                     SELECT face_status FROM attendance 
                     WHERE uid = ? 
                       AND timestamp >= datetime('now', '-30 seconds')
                       AND face_status IN ('MATCH', 'MISMATCH')
+                      {reader_filter}
                     ORDER BY id DESC LIMIT 1
-                ''', (uid,)).fetchone()
+                ''', params).fetchone()
                 
                 if recent_face_row:
                     face_status = recent_face_row['face_status']
-                    print(f"[SYNC] Resolved UNKNOWN -> {face_status} for {uid}")
+                    print(f"[SYNC] Resolved UNKNOWN -> {face_status} for {uid} (reader: {reader_id or '-'})")
             except Exception as ex:
                 print(f"[SYNC WARNING] Failed to lookup recent face: {ex}")
 
@@ -119,9 +154,9 @@ def tap():
         # 2. Log Attendance
         # timestamp is handled by DEFAULT CURRENT_TIMESTAMP (UTC)
         cursor.execute('''
-            INSERT INTO attendance (uid, nama, nim, action, face_status) 
-            VALUES (?, ?, ?, ?, ?)
-        ''', (uid, nama, nim, action, face_status))
+            INSERT INTO attendance (uid, nama, nim, action, face_status, reader_id) 
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (uid, nama, nim, action, face_status, reader_id))
 
         
         conn.commit()